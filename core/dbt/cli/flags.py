@@ -296,10 +296,7 @@ class Flags:
         # with the possibility of removing it in a future release.
         if getattr(self, "LOG_PATH", None) is None:
             project_dir = getattr(self, "PROJECT_DIR", str(default_project_dir()))
-            version_check = getattr(self, "VERSION_CHECK", True)
-            object.__setattr__(
-                self, "LOG_PATH", default_log_path(Path(project_dir), version_check)
-            )
+            object.__setattr__(self, "LOG_PATH", default_log_path(Path(project_dir)))
 
         # Support console DO NOT TRACK initiative.
         if os.getenv("DO_NOT_TRACK", "").lower() in ("1", "t", "true", "y", "yes"):
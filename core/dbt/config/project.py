@@ -1,8 +1,9 @@
 import os
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from itertools import chain
-from typing import Any, Dict, List, Mapping, Optional, TypeVar, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypeVar, Union
 
 from typing_extensions import Protocol, runtime_checkable
 
@@ -10,7 +11,11 @@ from dbt import deprecations
 from dbt.adapters.contracts.connection import QueryComment
 from dbt.clients.yaml_helper import load_yaml_text
 from dbt.config.selectors import SelectorDict
-from dbt.config.utils import normalize_warn_error_options
+from dbt.config.utils import (
+    MissingYamlFileError,
+    load_yaml_file,
+    normalize_warn_error_options,
+)
 from dbt.constants import (
     DBT_PROJECT_FILE_NAME,
     DEPENDENCIES_FILE_NAME,
@@ -30,7 +35,7 @@ from dbt.exceptions import (
 from dbt.flags import get_flags
 from dbt.graph import SelectionSpec
 from dbt.node_types import NodeType
-from dbt.utils import MultiDict, coerce_dict_str, md5
+from dbt.utils import coerce_dict_str, md5
 from dbt.version import get_installed_version
 from dbt_common.clients.system import load_file_contents, path_exists
 from dbt_common.dataclass_schema import ValidationError
@@ -87,20 +92,28 @@ class IsFQNResource(Protocol):
 
 
 def _load_yaml(path):
-    contents = load_file_contents(path)
-    return load_yaml_text(contents)
+    return load_yaml_file(path)
+
+
+def _load_project_yml_dict(file_path):
+    try:
+        return _load_yaml(file_path) or {}
+    except MissingYamlFileError:
+        return {}
 
 
 def load_yml_dict(file_path):
+    # Not cached: the deps task rewrites package-lock.yml and reads it back
+    # within a single run.
     ret = {}
     if path_exists(file_path):
-        ret = _load_yaml(file_path) or {}
+        ret = load_yaml_text(load_file_contents(file_path)) or {}
     return ret
 
 
 def package_and_project_data_from_root(project_root):
-    packages_yml_dict = load_yml_dict(f"{project_root}/{PACKAGES_FILE_NAME}")
-    dependencies_yml_dict = load_yml_dict(f"{project_root}/{DEPENDENCIES_FILE_NAME}")
+    packages_yml_dict = _load_project_yml_dict(f"{project_root}/{PACKAGES_FILE_NAME}")
+    dependencies_yml_dict = _load_project_yml_dict(f"{project_root}/{DEPENDENCIES_FILE_NAME}")
 
     if "packages" in packages_yml_dict and "packages" in dependencies_yml_dict:
         msg = "The 'packages' key cannot be specified in both packages.yml and dependencies.yml"
@@ -155,7 +168,14 @@ def _parse_versions(versions: Union[List[str], str]) -> List[VersionSpecifier]:
     """
     if isinstance(versions, str):
         versions = versions.split(",")
-    return [VersionSpecifier.from_version_string(v) for v in versions]
+    return list(_parse_version_strings(tuple(versions)))
+
+
+@lru_cache(maxsize=128)
+def _parse_version_strings(versions: Tuple[str, ...]) -> Tuple[VersionSpecifier, ...]:
+    # Every project and installed package parses its require-dbt-version, and
+    # most of them use the same handful of specs.
+    return tuple(VersionSpecifier.from_version_string(v) for v in versions)
 
 
 def _all_source_paths(*args: List[str]) -> List[str]:
@@ -187,15 +207,15 @@ def load_raw_project(project_root: str) -> Dict[str, Any]:
     project_yaml_filepath = os.path.join(project_root, DBT_PROJECT_FILE_NAME)
 
     # get the project.yml contents
-    if not path_exists(project_yaml_filepath):
+    try:
+        project_dict = _load_yaml(project_yaml_filepath)
+    except MissingYamlFileError:
         raise DbtProjectError(
             MISSING_DBT_PROJECT_ERROR.format(
                 path=project_yaml_filepath, DBT_PROJECT_FILE_NAME=DBT_PROJECT_FILE_NAME
             )
         )
 
-    project_dict = _load_yaml(project_yaml_filepath)
-
     if not isinstance(project_dict, dict):
         raise DbtProjectError(f"{DBT_PROJECT_FILE_NAME} does not parse to a dictionary")
 
@@ -524,8 +544,9 @@ class PartialProject(RenderComponents):
             dbt_cloud=dbt_cloud,
             flags=flags,
         )
-        # sanity check - this means an internal issue
-        project.validate()
+        # No need to call project.validate() here: rendered.project_dict was
+        # already validated against ProjectContract above, and validating the
+        # Project again would round-trip every config dict a second time.
         return project
 
     @classmethod
@@ -582,11 +603,17 @@ class VarProvider:
 
     def __init__(self, vars: Dict[str, Dict[str, Any]]) -> None:
         self.vars = vars
+        # package_name -> global vars overlaid with that package's vars
+        self._merged_vars: Dict[str, Mapping[str, Any]] = {}
 
     def vars_for(self, node: IsFQNResource, adapter_type: str) -> Mapping[str, Any]:
-        # in v2, vars are only either project or globally scoped
-        merged = MultiDict([self.vars])
-        merged.add(self.vars.get(node.package_name, {}))
+        # in v2, vars are only either project or globally scoped, so the
+        # result only depends on the package name and can be reused.
+        package_name = node.package_name
+        merged = self._merged_vars.get(package_name)
+        if merged is None:
+            merged = {**self.vars, **self.vars.get(package_name, {})}
+            self._merged_vars[package_name] = merged
         return merged
 
     def to_dict(self):
@@ -641,7 +668,7 @@ class Project:
     dbt_cloud: Dict[str, Any]
     flags: Dict[str, Any]
 
-    @property
+    @cached_property
     def all_source_paths(self) -> List[str]:
         return _all_source_paths(
             self.model_paths,
@@ -652,6 +679,10 @@ class Project:
             self.test_paths,
         )
 
+    @cached_property
+    def _dbt_version_strings(self) -> List[str]:
+        return [v.to_version_string() for v in self.dbt_version]
+
     @property
     def generic_test_paths(self):
         generic_test_paths = []
@@ -673,6 +704,15 @@ class Project:
     def __eq__(self, other):
         if not (isinstance(other, self.__class__) and isinstance(self, other.__class__)):
             return False
+        if self is other:
+            return True
+        # compare a few cheap scalar fields before serializing both projects
+        if (
+            self.project_name != other.project_name
+            or self.project_root != other.project_root
+            or self.version != other.version
+        ):
+            return False
         return self.to_project_config(with_packages=True) == other.to_project_config(
             with_packages=True
         )
@@ -681,48 +721,49 @@ class Project:
         """Return a dict representation of the config that could be written to
         disk with `yaml.safe_dump` to get this configuration.
 
+        The returned dict shares its nested values (models, seeds, vars, ...)
+        with this project, so callers must not mutate it.
+
         :param with_packages bool: If True, include the serialized packages
             file in the root.
         :returns dict: The serialized profile.
         """
-        result = deepcopy(
-            {
-                "name": self.project_name,
-                "version": self.version,
-                "project-root": self.project_root,
-                "profile": self.profile_name,
-                "model-paths": self.model_paths,
-                "macro-paths": self.macro_paths,
-                "seed-paths": self.seed_paths,
-                "test-paths": self.test_paths,
-                "analysis-paths": self.analysis_paths,
-                "docs-paths": self.docs_paths,
-                "asset-paths": self.asset_paths,
-                "target-path": self.target_path,
-                "snapshot-paths": self.snapshot_paths,
-                "clean-targets": self.clean_targets,
-                "log-path": self.log_path,
-                "quoting": self.quoting,
-                "models": self.models,
-                "on-run-start": self.on_run_start,
-                "on-run-end": self.on_run_end,
-                "dispatch": self.dispatch,
-                "seeds": self.seeds,
-                "snapshots": self.snapshots,
-                "sources": self.sources,
-                "data_tests": self.data_tests,
-                "unit_tests": self.unit_tests,
-                "metrics": self.metrics,
-                "semantic-models": self.semantic_models,
-                "saved-queries": self.saved_queries,
-                "exposures": self.exposures,
-                "vars": self.vars.to_dict(),
-                "require-dbt-version": [v.to_version_string() for v in self.dbt_version],
-                "restrict-access": self.restrict_access,
-                "dbt-cloud": self.dbt_cloud,
-                "flags": self.flags,
-            }
-        )
+        result = {
+            "name": self.project_name,
+            "version": self.version,
+            "project-root": self.project_root,
+            "profile": self.profile_name,
+            "model-paths": self.model_paths,
+            "macro-paths": self.macro_paths,
+            "seed-paths": self.seed_paths,
+            "test-paths": self.test_paths,
+            "analysis-paths": self.analysis_paths,
+            "docs-paths": self.docs_paths,
+            "asset-paths": self.asset_paths,
+            "target-path": self.target_path,
+            "snapshot-paths": self.snapshot_paths,
+            "clean-targets": self.clean_targets,
+            "log-path": self.log_path,
+            "quoting": self.quoting,
+            "models": self.models,
+            "on-run-start": self.on_run_start,
+            "on-run-end": self.on_run_end,
+            "dispatch": self.dispatch,
+            "seeds": self.seeds,
+            "snapshots": self.snapshots,
+            "sources": self.sources,
+            "data_tests": self.data_tests,
+            "unit_tests": self.unit_tests,
+            "metrics": self.metrics,
+            "semantic-models": self.semantic_models,
+            "saved-queries": self.saved_queries,
+            "exposures": self.exposures,
+            "vars": self.vars.to_dict(),
+            "require-dbt-version": self._dbt_version_strings,
+            "restrict-access": self.restrict_access,
+            "dbt-cloud": self.dbt_cloud,
+            "flags": self.flags,
+        }
         if self.query_comment:
             result["query-comment"] = self.query_comment.to_dict(omit_none=True)
 
@@ -751,9 +792,13 @@ class Project:
         partial = PartialProject.from_project_root(project_root, verify_version=verify_version)
         return partial.render(renderer)
 
-    def hashed_name(self):
+    @cached_property
+    def _hashed_name(self) -> str:
         return md5(self.project_name)
 
+    def hashed_name(self):
+        return self._hashed_name
+
     def get_selector(self, name: str) -> Union[SelectionSpec, bool]:
         if name not in self.selectors:
             raise DbtRuntimeError(
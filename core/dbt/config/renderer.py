@@ -89,12 +89,22 @@ class ProjectPostprocessor(Dict[Keypath, Callable[[Any], Any]]):
             self[(k, "post-hook")] = _list_if_none_or_string
         self[("seeds", "column_types")] = _dict_if_none
 
-    def postprocess(self, value: Any, key: Keypath) -> Any:
-        if key in self:
-            handler = self[key]
-            return handler(value)
-
-        return value
+    def postprocess(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the keypath handlers to a rendered project dict in place.
+
+        Only the known keypaths are looked up, instead of checking every leaf
+        of the project against the handlers while rendering.
+        """
+        for keypath, handler in self.items():
+            parent: Any = project
+            for key in keypath[:-1]:
+                parent = parent.get(key)
+                if not isinstance(parent, dict):
+                    break
+            else:
+                if keypath[-1] in parent:
+                    parent[keypath[-1]] = handler(parent[keypath[-1]])
+        return project
 
 
 class DbtProjectYamlRenderer(BaseRenderer):
@@ -130,7 +140,7 @@ class DbtProjectYamlRenderer(BaseRenderer):
         project_root: str,
     ) -> Dict[str, Any]:
         """Render the project and insert the project root after rendering."""
-        rendered_project = self.render_data(project)
+        rendered_project = self._KEYPATH_HANDLERS.postprocess(self.render_data(project))
         rendered_project["project-root"] = project_root
         return rendered_project
 
@@ -147,10 +157,6 @@ class DbtProjectYamlRenderer(BaseRenderer):
     def render_selectors(self, selectors: Dict[str, Any]):
         return self.render_data(selectors)
 
-    def render_entry(self, value: Any, keypath: Keypath) -> Any:
-        result = super().render_entry(value, keypath)
-        return self._KEYPATH_HANDLERS.postprocess(result, keypath)
-
     def should_render_keypath(self, keypath: Keypath) -> bool:
         if not keypath:
             return True
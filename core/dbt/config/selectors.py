@@ -3,13 +3,13 @@ from pathlib import Path
 from typing import Any, Dict, Union
 
 from dbt.clients.yaml_helper import Dumper, Loader, load_yaml_text, yaml  # noqa: F401
+from dbt.config.utils import MissingYamlFileError, load_yaml_file
 from dbt.contracts.selection import SelectorFile
 from dbt.exceptions import DbtSelectorsError
 from dbt.graph import SelectionSpec, parse_from_selectors_definition
 from dbt.graph.selector_spec import SelectionCriteria
 from dbt_common.clients.system import (
     load_file_contents,
-    path_exists,
     resolve_path_from_base,
 )
 from dbt_common.dataclass_schema import ValidationError
@@ -95,9 +95,9 @@ class SelectorConfig(Dict[str, Dict[str, Union[SelectionSpec, bool]]]):
 def selector_data_from_root(project_root: str) -> Dict[str, Any]:
     selector_filepath = resolve_path_from_base("selectors.yml", project_root)
 
-    if path_exists(selector_filepath):
-        selectors_dict = load_yaml_text(load_file_contents(selector_filepath))
-    else:
+    try:
+        selectors_dict = load_yaml_file(selector_filepath)
+    except MissingYamlFileError:
         selectors_dict = None
     return selectors_dict
 
@@ -1,11 +1,58 @@
-from typing import Any, Dict, Optional
+import os
+import threading
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
 
 from dbt.clients import yaml_helper
 from dbt.events.types import InvalidOptionYAML
 from dbt.exceptions import DbtExclusivePropertyUseError, OptionNotYamlDictError
+from dbt_common.clients.system import load_file_contents
 from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtValidationError
 
+# path -> ((st_mtime_ns, st_size), parsed yaml), oldest entry first
+_YAML_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_YAML_FILE_CACHE_MAX_ENTRIES = 256
+_YAML_FILE_CACHE_LOCK = threading.Lock()
+
+
+class MissingYamlFileError(Exception):
+    """Raised by load_yaml_file when the file can't be stat'ed."""
+
+
+def load_yaml_file(path: str) -> Any:
+    """Read and parse the yaml file at path.
+
+    Parsed contents are cached per path and reused for as long as the file's
+    mtime and size are unchanged, so repeated project loads in a single
+    process skip the yaml parse. Only the most recently loaded
+    _YAML_FILE_CACHE_MAX_ENTRIES files are kept. A deep copy is returned, so
+    callers are free to mutate the result.
+
+    Like path_exists, any OSError or ValueError from the stat means the file
+    is treated as missing and MissingYamlFileError is raised. Errors from
+    reading or parsing the file propagate unchanged.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError) as exc:
+        raise MissingYamlFileError(path) from exc
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _YAML_FILE_CACHE_LOCK:
+        cached = _YAML_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return deepcopy(cached[1])
+
+    parsed = yaml_helper.load_yaml_text(load_file_contents(path))
+    with _YAML_FILE_CACHE_LOCK:
+        _YAML_FILE_CACHE.pop(path, None)
+        _YAML_FILE_CACHE[path] = (key, parsed)
+        # deps loads packages from temporary directories, so don't let
+        # entries accumulate for the life of the process
+        while len(_YAML_FILE_CACHE) > _YAML_FILE_CACHE_MAX_ENTRIES:
+            del _YAML_FILE_CACHE[next(iter(_YAML_FILE_CACHE))]
+    return deepcopy(parsed)
+
 
 def parse_cli_vars(var_string: str) -> Dict[str, Any]:
     return parse_cli_yaml_string(var_string, "vars")
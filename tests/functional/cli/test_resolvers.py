@@ -35,3 +35,12 @@ class TestDefaultLogPathWithProjectNoConfiguredLogPath:
         actual_log_path = default_log_path(project.project_root)
 
         assert actual_log_path == expected_log_path
+
+
+class TestDefaultLogPathProjectDirIsFile:
+    def test_default_log_path_project_dir_is_file(self, project):
+        # e.g. `--project-dir path/to/dbt_project.yml`
+        project_file = Path(project.project_root) / "dbt_project.yml"
+        actual_log_path = default_log_path(project_file)
+
+        assert actual_log_path == Path("logs")
@@ -11,13 +11,18 @@ import dbt.config
 import dbt.exceptions
 from dbt.adapters.contracts.connection import DEFAULT_QUERY_COMMENT, QueryComment
 from dbt.adapters.factory import load_plugin
-from dbt.config.project import Project, _get_required_version
+from dbt.config.project import (
+    Project,
+    _get_required_version,
+    _parse_version_strings,
+    load_raw_project,
+)
 from dbt.constants import DEPENDENCIES_FILE_NAME
 from dbt.contracts.project import GitPackage, LocalPackage, PackageConfig
 from dbt.flags import set_from_args
 from dbt.node_types import NodeType
 from dbt.tests.util import safe_set_invocation_context
-from dbt_common.exceptions import DbtRuntimeError
+from dbt_common.exceptions import DbtRuntimeError, DbtValidationError
 from dbt_common.semver import VersionSpecifier
 from tests.unit.config import (
     BaseConfigTest,
@@ -294,6 +299,30 @@ class TestProjectInitialization(BaseConfigTest):
 
         self.assertIn("No dbt_project.yml", str(exc.exception))
 
+    def test_project_root_is_a_file(self):
+        # e.g. `--project-dir path/to/dbt_project.yml`
+        project_file = os.path.join(self.project_dir, "dbt_project.yml")
+        with self.assertRaises(dbt.exceptions.DbtProjectError) as exc:
+            load_raw_project(project_file)
+
+        self.assertIn("No dbt_project.yml", str(exc.exception))
+
+    def test_project_file_permission_denied(self):
+        with mock.patch("dbt.config.utils.os.stat", side_effect=PermissionError("denied")):
+            with self.assertRaises(dbt.exceptions.DbtProjectError) as exc:
+                load_raw_project(self.project_dir)
+
+        self.assertIn("No dbt_project.yml", str(exc.exception))
+
+    def test_project_file_parse_error_is_not_missing(self):
+        with open(os.path.join(self.project_dir, "dbt_project.yml"), "w") as fp:
+            fp.write("name: [unclosed\n")
+
+        with self.assertRaises(DbtValidationError) as exc:
+            load_raw_project(self.project_dir)
+
+        self.assertNotIn("No dbt_project.yml", str(exc.exception))
+
     def test_invalid_version(self):
         self.default_project_data["require-dbt-version"] = "hello!"
         with self.assertRaises(dbt.exceptions.DbtProjectError):
@@ -510,6 +539,13 @@ class TestVarLookups(unittest.TestCase):
             value = vars_provider.vars_for(node, "postgres").get(key)
             assert value == expected_value
 
+    def test_lookups_are_cached_per_package(self):
+        vars_provider = dbt.config.project.VarProvider(self.initial_src_vars)
+
+        local_vars = vars_provider.vars_for(self.local_var_search, "postgres")
+        assert vars_provider.vars_for(self.local_var_search, "postgres") is local_vars
+        assert vars_provider.vars_for(self.other_var_search, "postgres") is not local_vars
+
 
 class TestMultipleProjectFlags(BaseConfigTest):
     def setUp(self):
@@ -586,3 +622,27 @@ class TestGetRequiredVersion:
             match="The package version requirement can never be satisfied",
         ):
             _get_required_version(project_dict=project_dict, verify_version=True)
+
+    def test_repeated_version_is_parsed_once(self, project_dict: Dict[str, Any]) -> None:
+        _parse_version_strings.cache_clear()
+        project_dict["require-dbt-version"] = ">0.0.0,<=99999.0.0"
+        with mock.patch.object(
+            VersionSpecifier,
+            "from_version_string",
+            wraps=VersionSpecifier.from_version_string,
+        ) as from_version_string:
+            first = _get_required_version(project_dict=project_dict, verify_version=True)
+            second = _get_required_version(project_dict=project_dict, verify_version=True)
+
+        assert from_version_string.call_count == 2
+        assert first == second
+        # each call gets its own list
+        assert first is not second
+        first.pop()
+        assert len(second) == 2
+
+    def test_invalid_version_error_is_not_cached(self, project_dict: Dict[str, Any]) -> None:
+        project_dict["require-dbt-version"] = "hello!"
+        for _ in range(2):
+            with pytest.raises(dbt.exceptions.DbtProjectError):
+                _get_required_version(project_dict=project_dict, verify_version=False)
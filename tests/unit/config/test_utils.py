@@ -1,7 +1,14 @@
+import os
+from unittest import mock
+
 import pytest
 
+from dbt.clients import yaml_helper
 from dbt.config.utils import (
+    _YAML_FILE_CACHE,
+    MissingYamlFileError,
     exclusive_primary_alt_value_setting,
+    load_yaml_file,
     normalize_warn_error_options,
 )
 from dbt.exceptions import DbtExclusivePropertyUseError
@@ -72,3 +79,68 @@ class TestNormalizeWarnErrorOptions:
         normalize_warn_error_options(test_dict)
         assert test_dict.get("include") is None
         assert test_dict.get("exclude") is None
+
+
+class TestLoadYamlFile:
+    def test_reuses_parse_until_file_changes(self, tmp_path):
+        path = str(tmp_path / "dbt_project.yml")
+        with open(path, "w") as fp:
+            fp.write("name: my_project\n")
+
+        with mock.patch.object(
+            yaml_helper, "load_yaml_text", wraps=yaml_helper.load_yaml_text
+        ) as load_yaml_text:
+            first = load_yaml_file(path)
+            second = load_yaml_file(path)
+            assert first == second == {"name": "my_project"}
+            assert load_yaml_text.call_count == 1
+
+            # callers get their own copy
+            first["name"] = "changed"
+            assert load_yaml_file(path) == {"name": "my_project"}
+
+            with open(path, "w") as fp:
+                # same size, so only the mtime part of the cache key changes
+                fp.write("name: my_projecX\n")
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert load_yaml_file(path) == {"name": "my_projecX"}
+            assert load_yaml_text.call_count == 2
+
+    def test_stat_failure_is_missing(self, tmp_path):
+        path = str(tmp_path / "dbt_project.yml")
+        with open(path, "w") as fp:
+            fp.write("name: my_project\n")
+
+        with mock.patch("dbt.config.utils.os.stat", side_effect=PermissionError("denied")):
+            with pytest.raises(MissingYamlFileError):
+                load_yaml_file(path)
+
+        with pytest.raises(MissingYamlFileError):
+            load_yaml_file(str(tmp_path / "does_not_exist.yml"))
+
+    def test_read_failure_is_not_missing(self, tmp_path):
+        path = str(tmp_path / "dbt_project.yml")
+        with open(path, "w") as fp:
+            fp.write("name: my_project\n")
+
+        with mock.patch(
+            "dbt.config.utils.load_file_contents", side_effect=PermissionError("denied")
+        ):
+            with pytest.raises(PermissionError):
+                load_yaml_file(path)
+
+    def test_cache_is_bounded(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = str(tmp_path / f"file_{i}.yml")
+            with open(path, "w") as fp:
+                fp.write(f"name: project_{i}\n")
+            paths.append(path)
+
+        with mock.patch("dbt.config.utils._YAML_FILE_CACHE_MAX_ENTRIES", 2), mock.patch.dict(
+            _YAML_FILE_CACHE, clear=True
+        ):
+            for path in paths:
+                load_yaml_file(path)
+            assert list(_YAML_FILE_CACHE) == paths[1:]